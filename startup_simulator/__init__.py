@@ -1,11 +1,17 @@
-"""Startup Simulator package."""
+"""Startup Simulator package.
+
+Submodules are imported lazily on first attribute access so importing the
+package (or running ``--help``) does not load the data files up front.
+"""
 from __future__ import annotations
 
-from . import actions, config, events, finance, player, save_system, startup, terminal, ui_text
+import importlib
+from types import ModuleType
 
 __all__ = [
     "actions",
     "config",
+    "data_loader",
     "events",
     "finance",
     "player",
@@ -14,3 +20,13 @@ __all__ = [
     "terminal",
     "ui_text",
 ]
+
+
+def __getattr__(name: str) -> ModuleType:
+    if name in __all__:
+        return importlib.import_module(f".{name}", __name__)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
@@ -1,29 +1,125 @@
 """Definitions and utilities for player actions."""
 from __future__ import annotations
 
-from collections.abc import Iterable, Mapping
+from bisect import bisect_right
+from collections.abc import Mapping
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Any, Dict
+from types import MappingProxyType
+from typing import Any, Dict, List, Tuple
 
-import json
 import random
+import sys
 
 from . import config
+from .data_loader import read_json
 from .startup import Startup
 
 
+# Shared read-only stand-in for empty costs/effects so actions without them do
+# not each allocate their own dict.
+_EMPTY_DELTAS: Mapping[str, float] = MappingProxyType({})
+
+
+def _empty_deltas() -> Mapping[str, float]:
+    return _EMPTY_DELTAS
+
+
+# Net deltas and narrative applied when a risky action lands on a given outcome.
+_RiskBranch = Tuple[Mapping[str, float], str | None]
+
+
 @dataclass(frozen=True, slots=True)
 class Action:
     """Represents an actionable decision a player can take during a turn."""
 
     id: str
     name: str
-    costs: Mapping[str, float] = field(default_factory=dict)
-    effects: Mapping[str, float] = field(default_factory=dict)
+    costs: Mapping[str, float] = field(default_factory=_empty_deltas)
+    effects: Mapping[str, float] = field(default_factory=_empty_deltas)
     risk: Mapping[str, Any] | None = None
     narrative: str = ""
     max_per_turn: int | None = None
+    stages: Tuple[Mapping[str, float], ...] = field(init=False, repr=False, compare=False)
+    success_chance: float = field(init=False, repr=False, compare=False)
+    risk_branches: Tuple[_RiskBranch, _RiskBranch] | None = field(
+        init=False, repr=False, compare=False
+    )
+
+    def __post_init__(self) -> None:
+        # Validate the static deltas once so applying the action needs no
+        # per-turn key checks. Costs (stored as positive amounts) and effects
+        # stay separate stages: each is clamped before the next is applied.
+        stages = []
+        for deltas, sign in ((self.costs, -1), (self.effects, 1)):
+            stage: Dict[str, float] = {}
+            _merge_deltas(self.id, stage, deltas, sign)
+            if stage:
+                stages.append(stage)
+        object.__setattr__(self, "stages", tuple(stages))
+
+        # Risk outcomes are ordered (failure, success) so the roll's boolean
+        # result can index straight into the pair.
+        branches = None
+        success_chance = 0.0
+        if self.risk:
+            success_chance = float(self.risk.get("success_chance", 0.0))
+            branches = (
+                _resolve_branch(self.id, self.risk.get("failure")),
+                _resolve_branch(self.id, self.risk.get("success")),
+            )
+        object.__setattr__(self, "success_chance", success_chance)
+        object.__setattr__(self, "risk_branches", branches)
+
+
+def _merge_deltas(
+    action_id: str,
+    merged: Dict[str, float],
+    deltas: Mapping[str, Any],
+    sign: int = 1,
+) -> None:
+    """Accumulate *deltas* into *merged*, validating every attribute name."""
+
+    numeric_fields = Startup.NUMERIC_FIELDS
+    for key, delta in deltas.items():
+        if key not in numeric_fields:
+            raise ValueError(f"Action '{action_id}' references unknown startup attribute '{key}'.")
+        if not isinstance(delta, (int, float)):
+            delta = float(delta)
+        merged[key] = merged.get(key, 0) + sign * delta
+
+
+def _resolve_branch(action_id: str, branch: Any) -> _RiskBranch:
+    """Return the validated deltas and narrative for a risk *branch*."""
+
+    if not isinstance(branch, Mapping):
+        return _EMPTY_DELTAS, None
+    effects = branch.get("effects")
+    narrative = branch.get("narrative")
+    deltas: Mapping[str, float] = _EMPTY_DELTAS
+    if isinstance(effects, Mapping) and effects:
+        deltas = {}
+        _merge_deltas(action_id, deltas, effects)
+    return deltas, str(narrative) if narrative else None
+
+
+def _coerce_delta(value: Any) -> float:
+    # JSON numbers are kept as-is so whole-dollar costs stay ints in messages.
+    if type(value) is int or type(value) is float:
+        return value
+    return float(value)
+
+
+def _coerce_deltas(values: Mapping[str, Any]) -> Mapping[str, float]:
+    """Return *values* with every delta made numeric in one pass.
+
+    Keys are interned so later lookups against attribute names hit the
+    identity fast path in dict probing.
+    """
+
+    if not values:
+        return _EMPTY_DELTAS
+    return dict(zip(map(sys.intern, values.keys()), map(_coerce_delta, values.values())))
 
 
 def _coerce_action(data: Mapping[str, Any]) -> Action:
@@ -38,20 +134,20 @@ def _coerce_action(data: Mapping[str, Any]) -> Action:
 
     costs: Mapping[str, float]
     if "costs" in data and isinstance(data["costs"], Mapping):
-        costs = dict(data["costs"])
+        costs = _coerce_deltas(data["costs"])
     elif "cost" in data:
         # Legacy single-cost field assumed to target the balance attribute.
         costs = {"balance": float(data["cost"]) }
     else:
-        costs = {}
+        costs = _EMPTY_DELTAS
 
     effects: Mapping[str, float]
     if "effects" in data and isinstance(data["effects"], Mapping):
-        effects = dict(data["effects"])
+        effects = _coerce_deltas(data["effects"])
     elif "impact" in data and isinstance(data["impact"], Mapping):
-        effects = dict(data["impact"])
+        effects = _coerce_deltas(data["impact"])
     else:
-        effects = {}
+        effects = _EMPTY_DELTAS
 
     risk = data.get("risk") if isinstance(data.get("risk"), Mapping) else None
 
@@ -60,8 +156,8 @@ def _coerce_action(data: Mapping[str, Any]) -> Action:
         max_per_turn = int(max_per_turn)
 
     return Action(
-        id=str(action_id),
-        name=str(name),
+        id=sys.intern(str(action_id)),
+        name=sys.intern(str(name)),
         costs=costs,
         effects=effects,
         risk=risk,
@@ -73,15 +169,15 @@ def _coerce_action(data: Mapping[str, Any]) -> Action:
 def _load_from_json(path: Path) -> Dict[str, Action]:
     """Load actions from the provided JSON path."""
 
-    with path.open("r", encoding="utf-8") as handle:
-        raw_actions = json.load(handle)
+    raw_actions = read_json(path)
 
-    if not isinstance(raw_actions, Iterable):
+    # JSON documents decode to concrete list/dict objects, so skip the ABC checks.
+    if not isinstance(raw_actions, list):
         raise ValueError("Actions JSON must contain a list of action definitions.")
 
     actions: Dict[str, Action] = {}
     for entry in raw_actions:
-        if not isinstance(entry, Mapping):
+        if not isinstance(entry, dict):
             raise ValueError("Each action definition must be a JSON object.")
         action = _coerce_action(entry)
         actions[action.id] = action
@@ -154,38 +250,96 @@ def _fallback_actions() -> Dict[str, Action]:
     return {action.id: action for action in default_actions}
 
 
+_DEFAULT_ACTIONS_PATH: Path = config.DATA_DIRECTORY / "actions.json"
+
+# Parsed registries keyed by resolved path, tagged with the file's mtime so an
+# edited data file is picked up on the next call.
+_ACTION_CACHE: Dict[Path, Tuple[int, Dict[str, Action]]] = {}
+
+
 def load_actions(data_path: Path | None = None) -> Dict[str, Action]:
-    """Load available actions, falling back to defaults if necessary."""
+    """Load available actions, falling back to defaults if necessary.
+
+    Parsed files are cached until their modification time changes, so repeated
+    calls only touch the disk for a ``stat``.
+    """
 
-    path = data_path or (config.DATA_DIRECTORY / "actions.json")
-    try:
-        return _load_from_json(path)
-    except FileNotFoundError:
+    path = data_path or _DEFAULT_ACTIONS_PATH
+    if not path.is_file():
         return _fallback_actions()
 
+    mtime = path.stat().st_mtime_ns
+    key = path.resolve()
+    cached = _ACTION_CACHE.get(key)
+    if cached is None or cached[0] != mtime:
+        cached = (mtime, _load_from_json(path))
+        _ACTION_CACHE[key] = cached
+    return dict(cached[1])
+
+
+# Populated on first use so importing the module does not touch the disk;
+# reading ``ACTION_REGISTRY`` resolves to it through the module ``__getattr__``
+# until that name is assigned directly. Read-only so the affordability index
+# cached below can never go stale through an in-place edit; swap the whole
+# mapping to change the available actions.
+_ACTION_REGISTRY: Mapping[str, Action] | None = None
+
+
+def get_registry() -> Mapping[str, Action]:
+    """Return the active action registry, loading the defaults on first use."""
 
-ACTION_REGISTRY: Dict[str, Action] = load_actions()
+    global _ACTION_REGISTRY
 
+    # A module-level ``ACTION_REGISTRY`` bound by assignment (tests, mods)
+    # replaces the lazily loaded defaults.
+    override = globals().get("ACTION_REGISTRY")
+    if override is not None:
+        return override
+    if _ACTION_REGISTRY is None:
+        _ACTION_REGISTRY = MappingProxyType(load_actions())
+    return _ACTION_REGISTRY
 
-def _affordable(startup: Startup, action: Action) -> bool:
-    """Return whether the startup can currently afford the action."""
+
+def __getattr__(name: str) -> Any:
+    if name == "ACTION_REGISTRY":
+        return get_registry()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def _balance_cost(action: Action) -> float:
+    """Return the balance an action requires, or ``-inf`` when it costs none."""
 
     balance_cost = action.costs.get("balance")
-    if balance_cost is not None and startup.balance < balance_cost:
-        return False
-    return True
+    return float("-inf") if balance_cost is None else balance_cost
+
+
+# (registry, ascending balance costs, actions in the same order); rebuilt only
+# when a different registry object is in play.
+_AFFORDABILITY_INDEX: Tuple[Mapping[str, Action], List[float], List[Action]] | None = None
+
+
+def _affordability_index(registry: Mapping[str, Action]) -> Tuple[List[float], List[Action]]:
+    global _AFFORDABILITY_INDEX
+
+    index = _AFFORDABILITY_INDEX
+    if index is None or index[0] is not registry:
+        by_cost = sorted(registry.values(), key=_balance_cost)
+        index = (registry, [_balance_cost(action) for action in by_cost], by_cost)
+        _AFFORDABILITY_INDEX = index
+    return index[1], index[2]
 
 
 def list_actions(startup: Startup) -> list[Action]:
     """Return the list of actions available to the provided startup state."""
 
-    available = [action for action in ACTION_REGISTRY.values() if _affordable(startup, action)]
-    return sorted(available, key=lambda item: item.name)
+    costs, by_cost = _affordability_index(get_registry())
+    affordable = by_cost[: bisect_right(costs, startup.balance)]
+    return sorted(affordable, key=lambda item: item.name)
 
 
 def _clamp_turn_limit(limit: int | None) -> int:
     if limit is None:
-        limit = config.DEFAULT_ACTIONS_PER_TURN
+        return _DEFAULT_TURN_LIMIT
     minimum, maximum = config.ACTION_LIMIT_RANGE
     limit = max(minimum, limit)
     if maximum is not None:
@@ -193,18 +347,28 @@ def _clamp_turn_limit(limit: int | None) -> int:
     return limit
 
 
+# The configured default never changes at runtime, so clamp it once.
+_DEFAULT_TURN_LIMIT: int = _clamp_turn_limit(config.DEFAULT_ACTIONS_PER_TURN)
+
+
 def validate_action_limit(
     actions_taken: Mapping[str, int],
     action: Action,
     max_actions: int | None = None,
+    *,
+    total_taken: int | None = None,
 ) -> None:
     """Validate whether another instance of *action* can be taken this turn.
 
+    Callers that already track how many actions were taken this turn can pass
+    it as *total_taken* to skip re-summing *actions_taken*.
+
     Raises a :class:`ValueError` if a limit is exceeded.
     """
 
     limit = _clamp_turn_limit(max_actions)
-    total_taken = sum(actions_taken.values())
+    if total_taken is None:
+        total_taken = sum(actions_taken.values())
     if total_taken >= limit:
         raise ValueError(f"A maximum of {limit} actions may be taken per turn.")
 
@@ -217,59 +381,40 @@ def validate_action_limit(
             )
 
 
-def _apply_deltas(startup: Startup, deltas: Mapping[str, float]) -> None:
-    numeric_deltas: Dict[str, float] = {}
-    for key, delta in deltas.items():
-        if not hasattr(startup, key):
-            raise ValueError(f"Action references unknown startup attribute '{key}'.")
-        numeric_deltas[key] = float(delta)
-    if numeric_deltas:
-        startup.apply_deltas(numeric_deltas)
-
-
-def _apply_costs(startup: Startup, action: Action) -> None:
-    if not action.costs:
-        return
+def _check_affordable(startup: Startup, action: Action) -> None:
     balance_cost = action.costs.get("balance")
     if balance_cost is not None and startup.balance < balance_cost:
         raise ValueError(
             f"Insufficient balance to perform action '{action.name}'. Required {balance_cost}, have {startup.balance}."
         )
-    deltas = {key: -value for key, value in action.costs.items()}
-    _apply_deltas(startup, deltas)
 
 
 def apply_action(startup: Startup, action_id: str, rng: random.Random) -> tuple[Startup, str]:
-    """Apply *action_id* to *startup* using the provided RNG for stochastic outcomes."""
+    """Apply *action_id* to *startup* using the provided RNG for stochastic outcomes.
 
-    if action_id not in ACTION_REGISTRY:
+    Costs, effects and the risk outcome are applied as separate
+    :meth:`Startup.apply_deltas` calls so each stage is clamped on its own.
+    """
+
+    action = get_registry().get(action_id)
+    if action is None:
         raise ValueError(f"Unknown action id: {action_id}")
 
-    action = ACTION_REGISTRY[action_id]
     narrative_parts = [action.narrative.strip()] if action.narrative else []
 
-    _apply_costs(startup, action)
-    _apply_deltas(startup, action.effects)
+    _check_affordable(startup, action)
+    for deltas in action.stages:
+        startup.apply_deltas(deltas)
 
     outcome_text: str | None = None
-    if action.risk:
-        success_chance = float(action.risk.get("success_chance", 0.0))
-        roll = rng.random()
-        branch_key = "success" if roll < success_chance else "failure"
-        branch = action.risk.get(branch_key)
-        if isinstance(branch, Mapping):
-            branch_effects = branch.get("effects")
-            if isinstance(branch_effects, Mapping):
-                _apply_deltas(startup, branch_effects)
-            outcome_text = str(branch.get("narrative")) if branch.get("narrative") else None
-        else:
-            outcome_text = None
+    if action.risk_branches is not None:
+        deltas, outcome_text = action.risk_branches[rng.random() < action.success_chance]
+        if deltas:
+            startup.apply_deltas(deltas)
 
     if outcome_text:
         narrative_parts.append(outcome_text.strip())
 
-    startup.clamp_all()
-
     final_narrative = " ".join(part for part in narrative_parts if part)
     return startup, final_narrative
 
@@ -278,6 +423,7 @@ __all__ = [
     "Action",
     "ACTION_REGISTRY",
     "apply_action",
+    "get_registry",
     "list_actions",
     "load_actions",
     "validate_action_limit",
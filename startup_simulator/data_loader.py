@@ -0,0 +1,42 @@
+"""Shared helpers for reading and writing the simulator's JSON files."""
+from __future__ import annotations
+
+import json
+from pathlib import Path
+from typing import Any
+
+try:  # pragma: no cover - exercised implicitly depending on the environment
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+
+
+def read_json(path: Path) -> Any:
+    """Parse the JSON document stored at *path*.
+
+    The file is read as bytes in a single call and handed to :mod:`orjson`
+    when it is installed, falling back to the standard library otherwise.
+    Both parsers return the same plain ``dict``/``list`` structures.
+    """
+
+    raw = path.read_bytes()
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+def write_json(path: Path, data: Any) -> None:
+    """Write *data* to *path* as two-space indented UTF-8 JSON.
+
+    Serialisation goes through :mod:`orjson` when it is installed and the
+    encoded bytes are written in a single call.
+    """
+
+    if orjson is not None:
+        raw = orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    else:
+        raw = json.dumps(data, indent=2).encode("utf-8")
+    path.write_bytes(raw)
+
+
+__all__ = ["read_json", "write_json"]
@@ -2,13 +2,15 @@
 from __future__ import annotations
 
 from collections.abc import Callable, Mapping
-import json
 import random
+import sys
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, Dict, Iterable, List, Tuple
+from types import MappingProxyType
+from typing import Any, Dict, List, Tuple
 
 from . import config
+from .data_loader import read_json
 from .startup import Startup
 
 
@@ -18,15 +20,27 @@ from .startup import Startup
 
 @dataclass(frozen=True, slots=True)
 class GameEvent:
-    """Describes a random event that can occur during the simulation."""
+    """Describes a random event that can occur during the simulation.
+
+    Data-driven events carry their deltas in ``effects``/``revert_effects``,
+    which are handed straight to :meth:`Startup.apply_deltas`. The ``apply``
+    and ``revert`` hooks remain for events that need custom behaviour.
+    """
 
     id: str
     name: str
     trigger_chance: float
     duration_turns: int
-    apply: Callable[[Startup], None]
+    apply: Callable[[Startup], None] | None = None
     revert: Callable[[Startup], None] | None = None
     narrative: str = ""
+    effects: Mapping[str, float] | None = None
+    revert_effects: Mapping[str, float] | None = None
+
+    def __post_init__(self) -> None:
+        # Bake in the generic narrative so triggering never has to build it.
+        if not self.narrative:
+            object.__setattr__(self, "narrative", f"{self.name} occurs.")
 
 
 # ---------------------------------------------------------------------------
@@ -45,16 +59,14 @@ def _normalize_metric(value: float) -> float:
     return _clamp_probability(normalised)
 
 
-def _build_effect_callable(effects: Mapping[str, float] | None) -> Callable[[Startup], None]:
-    """Create a callable that applies *effects* to a :class:`Startup` instance."""
-
-    effects = dict(effects or {})
+def _freeze_effects(effects: Mapping[str, float] | None) -> Mapping[str, float] | None:
+    """Return a read-only copy of *effects*, or ``None`` when there are none."""
 
-    def _apply(startup: Startup) -> None:
-        if effects:
-            startup.apply_deltas(effects)
-
-    return _apply
+    if not effects:
+        return None
+    # Attribute names repeat across every definition; intern them so the
+    # per-turn ``apply_deltas`` lookups compare by identity.
+    return MappingProxyType({sys.intern(key): value for key, value in effects.items()})
 
 
 def _coerce_event(data: Mapping[str, Any]) -> GameEvent:
@@ -72,40 +84,36 @@ def _coerce_event(data: Mapping[str, Any]) -> GameEvent:
     duration = data.get("duration_turns") or data.get("duration") or data.get("turns") or 1
     duration_turns = max(1, int(duration))
 
-    effects = data.get("effects") or data.get("impact") or {}
-    revert_effects = data.get("revert_effects") or data.get("revert")
+    effects = _freeze_effects(data.get("effects") or data.get("impact"))
+    revert_effects = _freeze_effects(data.get("revert_effects") or data.get("revert"))
 
-    apply_callable = _build_effect_callable(effects)
-    revert_callable = None
-    if revert_effects:
-        revert_callable = _build_effect_callable(revert_effects)
-    elif duration_turns > 1 and effects:
-        inverted = {key: -value for key, value in dict(effects).items()}
-        revert_callable = _build_effect_callable(inverted)
+    if revert_effects is None and duration_turns > 1 and effects:
+        # Keys are already interned, so the inverted dict is wrapped as-is.
+        revert_effects = MappingProxyType({key: -value for key, value in effects.items()})
 
     return GameEvent(
-        id=str(event_id),
+        id=sys.intern(str(event_id)),
         name=str(name),
         trigger_chance=trigger_chance,
         duration_turns=duration_turns,
-        apply=apply_callable,
-        revert=revert_callable,
         narrative=str(narrative),
+        effects=effects,
+        revert_effects=revert_effects,
     )
 
 
 def _load_from_json(path: Path) -> Dict[str, GameEvent]:
     """Load game events from the provided JSON file."""
 
-    with path.open("r", encoding="utf-8") as handle:
-        raw_events = json.load(handle)
+    raw_events = read_json(path)
 
-    if not isinstance(raw_events, Iterable):
+    # JSON documents decode to concrete list/dict objects, so skip the ABC checks.
+    if not isinstance(raw_events, list):
         raise ValueError("Events JSON must contain a list of event definitions.")
 
     events: Dict[str, GameEvent] = {}
     for entry in raw_events:
-        if not isinstance(entry, Mapping):
+        if not isinstance(entry, dict):
             raise ValueError("Each event definition must be a JSON object.")
         event = _coerce_event(entry)
         events[event.id] = event
@@ -123,173 +131,232 @@ def _fallback_events() -> Dict[str, GameEvent]:
                 name="Major Server Crash",
                 trigger_chance=0.18,
                 duration_turns=2,
-                apply=_build_effect_callable(
+                narrative="A severe outage shakes user trust and the team scrambles to recover.",
+                effects=_freeze_effects(
                     {
                         "monthly_revenue": -12000,
                         "brand_awareness": -6.0,
                         "team_morale": -4.0,
                     }
                 ),
-                revert=_build_effect_callable({"monthly_revenue": 12000, "team_morale": 2.0}),
-                narrative="A severe outage shakes user trust and the team scrambles to recover.",
+                revert_effects=_freeze_effects({"monthly_revenue": 12000, "team_morale": 2.0}),
             ),
             GameEvent(
                 id="pr_boost",
                 name="Glowingly Positive Press",
                 trigger_chance=0.22,
                 duration_turns=1,
-                apply=_build_effect_callable(
+                narrative="Tech media hails your momentum and signups spike overnight.",
+                effects=_freeze_effects(
                     {
                         "brand_awareness": 10.0,
                         "monthly_revenue": 6000,
                         "users": 450,
                     }
                 ),
-                narrative="Tech media hails your momentum and signups spike overnight.",
             ),
             GameEvent(
                 id="talent_poached",
                 name="Key Talent Poached",
                 trigger_chance=0.12,
                 duration_turns=3,
-                apply=_build_effect_callable({"headcount": -2, "team_morale": -8.0}),
-                revert=_build_effect_callable({"team_morale": 4.0}),
                 narrative="A competitor lures away senior engineers, rattling the remaining team.",
+                effects=_freeze_effects({"headcount": -2, "team_morale": -8.0}),
+                revert_effects=_freeze_effects({"team_morale": 4.0}),
             ),
             GameEvent(
                 id="customer_uprising",
                 name="Customer Advocacy Uprising",
                 trigger_chance=0.1,
                 duration_turns=2,
-                apply=_build_effect_callable({"churn_rate": -0.01, "brand_awareness": 8.0}),
-                revert=_build_effect_callable({"churn_rate": 0.01}),
                 narrative="Power users rally behind you, convincing friends to stick around.",
+                effects=_freeze_effects({"churn_rate": -0.01, "brand_awareness": 8.0}),
+                revert_effects=_freeze_effects({"churn_rate": 0.01}),
             ),
         )
     }
 
 
-def load_events(data_path: Path | None = None) -> List[GameEvent]:
-    """Load available events, falling back to defaults if necessary."""
+_DEFAULT_EVENTS_PATH: Path = config.DATA_DIRECTORY / "events.json"
 
-    path = data_path or (config.DATA_DIRECTORY / "events.json")
-    try:
-        registry = _load_from_json(path)
-    except FileNotFoundError:
+
+# Parsed registries keyed by resolved path, tagged with the file's mtime so an
+# edited data file is picked up on the next call.
+_EVENT_CACHE: Dict[Path, Tuple[int, Dict[str, GameEvent]]] = {}
+
+
+def load_events(data_path: Path | None = None) -> List[GameEvent]:
+    """Load available events, falling back to defaults if necessary.
+
+    Parsed files are cached until their modification time changes, so repeated
+    calls only touch the disk for a ``stat``.
+    """
+
+    path = data_path or _DEFAULT_EVENTS_PATH
+    if path.is_file():
+        mtime = path.stat().st_mtime_ns
+        key = path.resolve()
+        cached = _EVENT_CACHE.get(key)
+        if cached is None or cached[0] != mtime:
+            cached = (mtime, _load_from_json(path))
+            _EVENT_CACHE[key] = cached
+        registry = cached[1]
+    else:
         registry = _fallback_events()
 
     return [registry[key] for key in sorted(registry)]
 
 
-EVENT_REGISTRY: Dict[str, GameEvent] = {event.id: event for event in load_events()}
+# Populated on first use so importing the module does not touch the disk;
+# reading ``EVENT_REGISTRY`` resolves to it through the module ``__getattr__``
+# until that name is assigned directly.
+# Read-only so the id-sorted order cached below can never go stale through an
+# in-place edit; swap the whole mapping to change the active events.
+_EVENT_REGISTRY: Mapping[str, GameEvent] | None = None
+
+
+def get_registry() -> Mapping[str, GameEvent]:
+    """Return the active event registry, loading the defaults on first use."""
+
+    global _EVENT_REGISTRY
+
+    # A module-level ``EVENT_REGISTRY`` bound by assignment (tests, mods)
+    # replaces the lazily loaded defaults.
+    override = globals().get("EVENT_REGISTRY")
+    if override is not None:
+        return override
+    if _EVENT_REGISTRY is None:
+        _EVENT_REGISTRY = MappingProxyType({event.id: event for event in load_events()})
+    return _EVENT_REGISTRY
+
+
+def __getattr__(name: str) -> Any:
+    if name == "EVENT_REGISTRY":
+        return get_registry()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 # ---------------------------------------------------------------------------
 # Active event helpers
 
 
-_ACTIVE_DELIMITER = ":"
+def apply_event_effects(startup: Startup, event: GameEvent) -> None:
+    """Apply the effects of *event* to *startup*."""
 
+    if event.effects:
+        startup.apply_deltas(event.effects)
+    if event.apply is not None:
+        # ``apply_deltas`` clamps on its own; custom hooks may not.
+        event.apply(startup)
+        startup.clamp_all()
 
-def _decode_active_events(values: Iterable[str]) -> Dict[str, int]:
-    """Decode the active event payload stored on the :class:`Startup`."""
 
-    decoded: Dict[str, int] = {}
-    for entry in values:
-        if not isinstance(entry, str):  # pragma: no cover - safeguard
-            continue
-        if _ACTIVE_DELIMITER in entry:
-            event_id, remaining = entry.split(_ACTIVE_DELIMITER, 1)
-        else:
-            event_id, remaining = entry, "0"
-        try:
-            turns_remaining = max(0, int(remaining))
-        except ValueError:
-            turns_remaining = 0
-        if event_id:
-            decoded[event_id] = turns_remaining
-    return decoded
+def _server_crash_bias(startup: Startup) -> float:
+    bug_pressure = _clamp_probability(1.0 - _normalize_metric(startup.product_quality))
+    return bug_pressure * 0.25
 
 
-def _encode_active_events(values: Mapping[str, int]) -> List[str]:
-    return [f"{event_id}{_ACTIVE_DELIMITER}{max(0, int(turns))}" for event_id, turns in values.items()]
+def _pr_boost_bias(startup: Startup) -> float:
+    return _normalize_metric(startup.brand_awareness) * 0.2
 
 
-def apply_event_effects(startup: Startup, event: GameEvent) -> None:
-    """Apply the effects of *event* to *startup*."""
+def _talent_poached_bias(startup: Startup) -> float:
+    morale_ratio = _normalize_metric(startup.team_morale)
+    morale_gap = _clamp_probability(max(0.0, 0.75 - morale_ratio))
+    return morale_gap * 0.15
+
+
+def _customer_uprising_bias(startup: Startup) -> float:
+    return _normalize_metric(startup.product_quality) * 0.12
 
-    event.apply(startup)
-    startup.clamp_all()
+
+# State-driven adjustments to the base trigger chance, keyed by event id.
+_EVENT_BIAS: Dict[str, Callable[[Startup], float]] = {
+    "server_crash": _server_crash_bias,
+    "pr_boost": _pr_boost_bias,
+    "talent_poached": _talent_poached_bias,
+    "customer_uprising": _customer_uprising_bias,
+}
 
 
 def _state_adjusted_chance(startup: Startup, event: GameEvent) -> float:
     """Return the trigger chance for *event* adjusted for current state."""
 
     base_chance = event.trigger_chance * config.EVENT_PROBABILITY_WEIGHT
+    bias = _EVENT_BIAS.get(event.id)
+    if bias is not None:
+        base_chance += bias(startup)
+    return _clamp_probability(base_chance)
 
-    if event.id == "server_crash":
-        bug_pressure = _clamp_probability(1.0 - _normalize_metric(startup.product_quality))
-        base_chance += bug_pressure * 0.25
-    elif event.id == "pr_boost":
-        reputation = _normalize_metric(startup.brand_awareness)
-        base_chance += reputation * 0.2
-    elif event.id == "talent_poached":
-        morale_ratio = _normalize_metric(startup.team_morale)
-        morale_gap = _clamp_probability(max(0.0, 0.75 - morale_ratio))
-        base_chance += morale_gap * 0.15
-    elif event.id == "customer_uprising":
-        happy_customers = _normalize_metric(startup.product_quality)
-        base_chance += happy_customers * 0.12
 
-    return _clamp_probability(base_chance)
+# (registry, events sorted by id); rebuilt only when a different registry
+# object is in play.
+_SORTED_EVENTS: Tuple[Mapping[str, GameEvent], Tuple[GameEvent, ...]] | None = None
+
+
+def _events_in_order(registry: Mapping[str, GameEvent]) -> Tuple[GameEvent, ...]:
+    global _SORTED_EVENTS
+
+    cached = _SORTED_EVENTS
+    if cached is None or cached[0] is not registry:
+        cached = (registry, tuple(registry[key] for key in sorted(registry)))
+        _SORTED_EVENTS = cached
+    return cached[1]
 
 
 def maybe_trigger_event(startup: Startup, rng: random.Random) -> Tuple[Startup, List[str]]:
-    """Potentially trigger an event for *startup*, returning narratives."""
+    """Potentially trigger an event for *startup*, returning narratives.
+
+    Events are considered in id order with one RNG draw each and the first
+    hit wins, so a seeded game replays the same events.
+    """
 
     narratives: List[str] = []
-    active = _decode_active_events(startup.active_events)
+    active = startup.active_events
 
-    for event_id in sorted(EVENT_REGISTRY):
-        if event_id in active and active[event_id] > 0:
+    for event in _events_in_order(get_registry()):
+        if active.get(event.id, 0) > 0:
             continue
-        event = EVENT_REGISTRY[event_id]
-        chance = _state_adjusted_chance(startup, event)
-        roll = rng.random()
-        if roll <= chance:
+        if rng.random() <= _state_adjusted_chance(startup, event):
             apply_event_effects(startup, event)
             if event.duration_turns > 0:
                 active[event.id] = event.duration_turns
-            narrative = event.narrative or f"{event.name} occurs."
-            narratives.append(narrative)
+            narratives.append(event.narrative)
             break
 
-    startup.active_events = _encode_active_events(active)
-    startup.clamp_all()
     return startup, narratives
 
 
 def tick_active_events(startup: Startup) -> List[str]:
     """Advance durations and resolve events that have completed."""
 
+    active = startup.active_events
+    if not active:
+        return []
+
+    registry = get_registry()
     messages: List[str] = []
-    active = _decode_active_events(startup.active_events)
     updated: Dict[str, int] = {}
+    needs_clamp = False
 
     for event_id, turns in active.items():
-        event = EVENT_REGISTRY.get(event_id)
+        event = registry.get(event_id)
         if not event:
             continue
         remaining = max(0, turns - 1)
         if remaining > 0:
             updated[event_id] = remaining
         else:
-            if event.revert:
+            if event.revert_effects:
+                startup.apply_deltas(event.revert_effects)
+            if event.revert is not None:
                 event.revert(startup)
-                startup.clamp_all()
+                needs_clamp = True
             messages.append(f"{event.name} has concluded.")
 
-    startup.active_events = _encode_active_events(updated)
+    if needs_clamp:
+        startup.clamp_all()
+    startup.active_events = updated
     return messages
 
 
@@ -297,6 +364,7 @@ __all__ = [
     "GameEvent",
     "EVENT_REGISTRY",
     "apply_event_effects",
+    "get_registry",
     "load_events",
     "maybe_trigger_event",
     "tick_active_events",
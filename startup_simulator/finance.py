@@ -2,7 +2,7 @@
 from __future__ import annotations
 
 import random
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import TYPE_CHECKING
 
 from . import config
@@ -11,22 +11,23 @@ if TYPE_CHECKING:
     from .startup import Startup
 
 
-@dataclass(slots=True)
+@dataclass(frozen=True, slots=True)
 class FinancialSnapshot:
-    """Represents a snapshot of company finances for a single month."""
+    """Represents a snapshot of company finances for a single month.
+
+    ``net`` (revenue minus expenses) and ``burn`` (expenses minus revenue,
+    floored at zero) are derived once when the snapshot is created.
+    """
 
     revenue: float
     expenses: float
+    net: float = field(init=False)
+    burn: float = field(init=False)
 
-    @property
-    def burn(self) -> float:
-        """Return the monthly cash burn (expenses minus revenue)."""
-        return max(0.0, self.expenses - self.revenue)
-
-    @property
-    def net(self) -> float:
-        """Return the net cash movement for the month."""
-        return self.revenue - self.expenses
+    def __post_init__(self) -> None:
+        net = self.revenue - self.expenses
+        object.__setattr__(self, "net", net)
+        object.__setattr__(self, "burn", -net if net < 0 else 0.0)
 
 
 def calculate_runway(cash_on_hand: float, monthly_burn: float) -> float:
@@ -58,11 +59,9 @@ def compute_runway(balance: int, expenses: int) -> int:
         The number of full months the current balance can sustain the expenses.
     """
 
-    normalized_expenses = max(0, expenses)
-    if normalized_expenses == 0:
+    if expenses <= 0 or balance <= 0:
         return 0
-    normalized_balance = max(0, balance)
-    return normalized_balance // normalized_expenses
+    return balance // expenses
 
 
 def apply_monthly_finances(balance: int, revenue: int, expenses: int) -> int:
@@ -81,8 +80,7 @@ def apply_monthly_finances(balance: int, revenue: int, expenses: int) -> int:
         The resulting balance after the financial movements.
     """
 
-    normalized_expenses = max(0, expenses)
-    return balance + revenue - normalized_expenses
+    return balance + revenue - (expenses if expenses > 0 else 0)
 
 
 def projected_burn(balance: int, expenses: int, months: int) -> int:
@@ -104,14 +102,10 @@ def projected_burn(balance: int, expenses: int, months: int) -> int:
         The projected amount of cash consumed over the specified period.
     """
 
-    normalized_months = max(0, months)
-    if normalized_months == 0:
+    if months <= 0 or expenses <= 0 or balance <= 0:
         return 0
-
-    normalized_balance = max(0, balance)
-    normalized_expenses = max(0, expenses)
-    total_burn = normalized_expenses * normalized_months
-    return min(normalized_balance, total_burn)
+    total_burn = expenses * months
+    return total_burn if total_burn < balance else balance
 
 
 def adjust_expenses_for_regulation(expenses: int, severity: int) -> int:
@@ -132,10 +126,9 @@ def adjust_expenses_for_regulation(expenses: int, severity: int) -> int:
         The adjusted expense value after applying the regulatory impact.
     """
 
-    normalized_expenses = max(0, expenses)
-    adjustment = (normalized_expenses * severity) // 100
-    adjusted = normalized_expenses + adjustment
-    return max(0, adjusted)
+    normalized_expenses = expenses if expenses > 0 else 0
+    adjusted = normalized_expenses + (normalized_expenses * severity) // 100
+    return adjusted if adjusted > 0 else 0
 
 
 def economy_tick(state: Startup, rng: random.Random) -> None:
@@ -168,8 +161,11 @@ def economy_tick(state: Startup, rng: random.Random) -> None:
     revenue_multiplier = 1.0 + rng.uniform(revenue_low, revenue_high)
     expense_multiplier = 1.0 + rng.uniform(expense_low, expense_high)
 
-    state.monthly_revenue = max(0, int(round(state.monthly_revenue * revenue_multiplier)))
-    state.monthly_expenses = max(0, int(round(state.monthly_expenses * expense_multiplier)))
+    # Round half up; the values are non-negative once floored at zero.
+    revenue = state.monthly_revenue * revenue_multiplier
+    expenses = state.monthly_expenses * expense_multiplier
+    state.monthly_revenue = int(revenue + 0.5) if revenue > 0 else 0
+    state.monthly_expenses = int(expenses + 0.5) if expenses > 0 else 0
     state.clamp_all()
 
 
@@ -2,11 +2,10 @@
 from __future__ import annotations
 
 import argparse
-import json
 import random
+import re
 import sys
 import textwrap
-from collections import Counter
 from pathlib import Path
 from typing import Dict, Iterable, List
 
@@ -17,6 +16,7 @@ if __package__ in {None, ""}:  # pragma: no cover - convenience for script execu
     from startup_simulator import (
         actions,
         config,
+        data_loader,
         events,
         finance,
         save_system,
@@ -25,7 +25,13 @@ if __package__ in {None, ""}:  # pragma: no cover - convenience for script execu
         ui_text,
     )
 else:  # pragma: no cover
-    from . import actions, config, events, finance, save_system, startup, terminal, ui_text
+    from . import actions, config, data_loader, events, finance, save_system, startup, terminal, ui_text
+
+
+# Shared wrappers so each wrapped paragraph does not build a new TextWrapper.
+_MESSAGE_WRAPPER = textwrap.TextWrapper(width=80, subsequent_indent="    ")
+_INDENTED_WRAPPER = textwrap.TextWrapper(width=80, initial_indent="    ", subsequent_indent="    ")
+_PARAGRAPH_WRAPPER = textwrap.TextWrapper(width=80)
 
 
 class SaveAndQuit(Exception):
@@ -80,15 +86,30 @@ def parse_args() -> argparse.Namespace:
     return args
 
 
+_SELECTION_SPLIT = re.compile(r"[,;]")
+_SAVE_TOKENS = frozenset(("s", "save"))
+_QUIT_TOKENS = frozenset(("q", "quit"))
+
+
+_PROFILES_CACHE: List[Dict[str, object]] | None = None
+
+
 def _load_startup_profiles() -> List[Dict[str, object]]:
-    """Load available startup profiles from disk."""
+    """Load available startup profiles from disk.
 
-    profile_path = config.DATA_DIRECTORY / "startup_profiles.json"
-    with profile_path.open("r", encoding="utf-8") as handle:
-        data = json.load(handle)
-    if not isinstance(data, list) or not data:
-        raise ValueError("startup_profiles.json must contain at least one profile entry.")
-    return data
+    The file is parsed once per process; callers get a fresh list of the
+    shared profile dicts, which are treated as read-only.
+    """
+
+    global _PROFILES_CACHE
+
+    if _PROFILES_CACHE is None:
+        profile_path = config.DATA_DIRECTORY / "startup_profiles.json"
+        data = data_loader.read_json(profile_path)
+        if not isinstance(data, list) or not data:
+            raise ValueError("startup_profiles.json must contain at least one profile entry.")
+        _PROFILES_CACHE = data
+    return list(_PROFILES_CACHE)
 
 
 def _render_profile_menu(profiles: List[Dict[str, object]]) -> str:
@@ -98,14 +119,7 @@ def _render_profile_menu(profiles: List[Dict[str, object]]) -> str:
         description = str(profile.get("description", ""))
         lines.append(f"{index}. {name}")
         if description:
-            lines.append(
-                textwrap.fill(
-                    description,
-                    width=80,
-                    initial_indent="    ",
-                    subsequent_indent="    ",
-                )
-            )
+            lines.append(_INDENTED_WRAPPER.fill(description))
         lines.append("")
     lines.append("Press Enter to accept the default (option 1).")
     return "\n".join(lines).rstrip()
@@ -140,9 +154,10 @@ def choose_startup_profile(
         choice = input("Selection: ").strip()
         if not choice:
             return profiles[0]
-        if choice.lower() in {"s", "save"}:
+        command = choice.lower()
+        if command in _SAVE_TOKENS:
             raise SaveAndQuit()
-        if choice.lower() in {"q", "quit"}:
+        if command in _QUIT_TOKENS:
             raise QuitWithoutSaving()
         if choice.isdigit():
             index = int(choice)
@@ -157,8 +172,9 @@ def initialise_startup(profile: Dict[str, object], seed: int) -> startup.Startup
     instance = startup.Startup()
     metrics = profile.get("metrics")
     if isinstance(metrics, dict):
+        numeric_fields = startup.Startup.NUMERIC_FIELDS
         for key, value in metrics.items():
-            if hasattr(instance, key):
+            if key in numeric_fields:
                 setattr(instance, key, value)
     instance.rng_seed = seed
     instance.clamp_all()
@@ -178,12 +194,18 @@ def _parse_action_selection(raw: str, total: int) -> List[int]:
 
     if not raw:
         return []
-    tokens = [token.strip() for token in raw.replace(";", ",").split(",") if token.strip()]
+    # The usual answer is a single menu number; skip tokenising for it.
+    if len(raw) == 1 and "1" <= raw <= "9" and int(raw) <= total:
+        return [int(raw)]
     indices: List[int] = []
-    for token in tokens:
-        if token.lower() in {"s", "save"}:
+    for token in _SELECTION_SPLIT.split(raw):
+        token = token.strip()
+        if not token:
+            continue
+        command = token.lower()
+        if command in _SAVE_TOKENS:
             raise SaveAndQuit()
-        if token.lower() in {"q", "quit"}:
+        if command in _QUIT_TOKENS:
             raise QuitWithoutSaving()
         if token.isdigit():
             index = int(token)
@@ -202,8 +224,7 @@ def prompt_actions(available: List[actions.Action], max_actions: int) -> List[ac
         input("")
         return []
 
-    print(ui_text.render_actions_menu(available))
-    print(_render_action_prompt(max_actions))
+    print(f"{ui_text.render_actions_menu(available)}\n{_render_action_prompt(max_actions)}")
 
     while True:
         raw = input("Actions: ").strip()
@@ -217,16 +238,18 @@ def prompt_actions(available: List[actions.Action], max_actions: int) -> List[ac
             continue
         # Preserve selection order but avoid exceeding per-action limits
         chosen: List[actions.Action] = []
-        per_turn_counts: Counter[str] = Counter()
+        per_turn_counts: Dict[str, int] = {}
         for index in indices:
             action = available[index - 1]
             try:
-                actions.validate_action_limit(per_turn_counts, action, max_actions=max_actions)
+                actions.validate_action_limit(
+                    per_turn_counts, action, max_actions=max_actions, total_taken=len(chosen)
+                )
             except ValueError as exc:
                 print(exc)
                 break
             chosen.append(action)
-            per_turn_counts[action.id] += 1
+            per_turn_counts[action.id] = per_turn_counts.get(action.id, 0) + 1
         else:
             return chosen
 
@@ -240,64 +263,84 @@ def _apply_actions(
     """Apply the selected actions to the startup and return narratives."""
 
     narratives: List[str] = []
-    per_turn_counts: Counter[str] = Counter()
+    per_turn_counts: Dict[str, int] = {}
     allowed_actions = max_actions if max_actions is not None else config.DEFAULT_ACTIONS_PER_TURN
-    for action in selections:
-        actions.validate_action_limit(per_turn_counts, action, max_actions=allowed_actions)
-        per_turn_counts[action.id] += 1
+    for total_taken, action in enumerate(selections):
+        actions.validate_action_limit(
+            per_turn_counts, action, max_actions=allowed_actions, total_taken=total_taken
+        )
+        per_turn_counts[action.id] = per_turn_counts.get(action.id, 0) + 1
         state, narrative = actions.apply_action(state, action.id, rng)
         if narrative:
             narratives.append(narrative)
     return narratives
 
 
-def _check_endings(state: startup.Startup) -> tuple[str, str] | None:
-    """Return an ending tuple of (title, description) if conditions are met."""
-
-    if state.balance <= 0:
-        return (
+# Ending id -> (title, description), with descriptions wrapped once up front.
+_ENDINGS: Dict[str, tuple[str, str]] = {
+    ending_id: (title, _PARAGRAPH_WRAPPER.fill(description))
+    for ending_id, title, description in (
+        (
+            "bankruptcy",
             "Bankruptcy",
             "Cash reserves have run dry and operations can no longer continue.",
-        )
-    if state.team_morale <= 5:
-        return (
+        ),
+        (
+            "walkout",
             "Team Walkout",
             "Morale collapsed and the remaining team resigned en masse.",
-        )
-    company_value = state.compute_company_value()
-    if company_value >= 5_000_000 and state.brand_awareness >= 75:
-        return (
+        ),
+        (
+            "exit",
             "Triumphant Exit",
             "Investors line up to acquire your thriving company at a stellar valuation.",
-        )
-    runway = state.recompute_runway()
-    if runway <= 1 and state.monthly_expenses > state.monthly_revenue and state.balance < 25_000:
-        return (
+        ),
+        (
+            "runway",
             "Out of Runway",
             "Runway has dwindled to nothing and additional funding could not be secured.",
-        )
-    if state.turn > 36:
-        return (
+        ),
+        (
+            "ipo",
             "IPO Ready",
             "Three years of steady execution culminate in a confident march towards an IPO.",
-        )
+        ),
+    )
+}
+
+
+def _check_endings(state: startup.Startup) -> tuple[str, str] | None:
+    """Return an ending tuple of (title, wrapped description) if conditions are met."""
+
+    if state.balance <= 0:
+        return _ENDINGS["bankruptcy"]
+    if state.team_morale <= 5:
+        return _ENDINGS["walkout"]
+    company_value = state.compute_company_value()
+    if company_value >= 5_000_000 and state.brand_awareness >= 75:
+        return _ENDINGS["exit"]
+    runway = state.recompute_runway()
+    if runway <= 1 and state.monthly_expenses > state.monthly_revenue and state.balance < 25_000:
+        return _ENDINGS["runway"]
+    if state.turn > 36:
+        return _ENDINGS["ipo"]
     return None
 
 
 def _print_turn_intro(state: startup.Startup) -> None:
     header = f"\n=== Month {state.turn} ==="
-    print(terminal.header(header))
-    print(ui_text.render_dashboard(state))
+    print(f"{terminal.header(header)}\n{ui_text.render_dashboard(state)}")
 
 
 def _print_messages(title: str, messages: Iterable[str]) -> None:
     collected = [msg for msg in messages if msg]
     if not collected:
         return
-    print(terminal.header(f"\n{title}"))
+    lines = [terminal.header(f"\n{title}")]
     for message in collected:
-        wrapped = textwrap.fill(message, width=80, subsequent_indent="    ")
-        print(f"  • {wrapped}")
+        wrapped = _MESSAGE_WRAPPER.fill(message)
+        lines.append(f"  • {wrapped}")
+    print("\n".join(lines))
 
 
 def run() -> None:
@@ -367,11 +410,14 @@ def run() -> None:
             ending = _check_endings(state)
             if ending:
                 title, description = ending
-                print(terminal.title("\n=== Simulation Complete ==="))
-                print(f"Ending: {title}")
-                print(textwrap.fill(description, width=80))
-                print("\nFinal Company Snapshot:\n")
-                print(ui_text.render_dashboard(state))
+                summary = [
+                    terminal.title("\n=== Simulation Complete ==="),
+                    f"Ending: {title}",
+                    description,
+                    "\nFinal Company Snapshot:\n",
+                    ui_text.render_dashboard(state),
+                ]
+                print("\n".join(summary))
                 if args.autosave:
                     save_system.save_game(state)
                     print(f"\nFinal state autosaved to {config.AUTOSAVE_FILENAME}.")
@@ -1,12 +1,13 @@
 """Simple save and load utilities for the simulator."""
 from __future__ import annotations
 
-from datetime import datetime, timezone
-import json
+from datetime import datetime
+import time
 from pathlib import Path
-from typing import Any, Mapping
+from typing import Any, Dict, Mapping, Tuple
 
 from . import config
+from .data_loader import read_json, write_json
 from .startup import Startup
 
 
@@ -16,9 +17,19 @@ _REQUIRED_KEYS: tuple[str, ...] = ("version", "timestamp", "turn", "rng_seed", "
 
 
 def _current_timestamp() -> str:
-    """Return a timezone-aware ISO8601 timestamp."""
+    """Return a timezone-aware ISO8601 timestamp.
 
-    return datetime.now(timezone.utc).isoformat()
+    Formatted straight from :func:`time.time_ns` in the same shape as
+    ``datetime.now(timezone.utc).isoformat()`` without building a datetime.
+    """
+
+    now_ns = time.time_ns()
+    seconds, remainder_ns = divmod(now_ns, 1_000_000_000)
+    t = time.gmtime(seconds)
+    return (
+        f"{t.tm_year:04d}-{t.tm_mon:02d}-{t.tm_mday:02d}"
+        f"T{t.tm_hour:02d}:{t.tm_min:02d}:{t.tm_sec:02d}.{remainder_ns // 1000:06d}+00:00"
+    )
 
 
 def validate_snapshot(data: Mapping[str, Any] | None) -> bool:
@@ -47,21 +58,47 @@ def validate_snapshot(data: Mapping[str, Any] | None) -> bool:
     return True
 
 
+# (resolved path, file mtime after writing, startup snapshot) for the most
+# recent save, so saving an unchanged game again skips encoding and writing.
+_LAST_SAVE: Tuple[Path, int, Dict[str, Any]] | None = None
+
+
+def _already_saved(save_path: Path, state: Mapping[str, Any]) -> bool:
+    last = _LAST_SAVE
+    if last is None or last[2] != state:
+        return False
+    try:
+        return save_path.resolve() == last[0] and save_path.stat().st_mtime_ns == last[1]
+    except OSError:
+        return False
+
+
 def save_game(startup: Startup, path: Path | None = None) -> None:
-    """Persist a :class:`Startup` instance to disk."""
+    """Persist a :class:`Startup` instance to disk.
+
+    When the state matches what this process last wrote to the same file,
+    and that file has not been modified or deleted since, the write is
+    skipped and the existing save (including its timestamp) is kept as-is.
+    Loading a game clears this record, so the next save always writes.
+    """
+
+    global _LAST_SAVE
 
     save_path = path or SAVE_PATH
+    state = startup.snapshot()
+    if _already_saved(save_path, state):
+        return
     snapshot = {
         "version": SCHEMA_VERSION,
         "timestamp": _current_timestamp(),
         "turn": int(startup.turn),
         "rng_seed": int(startup.rng_seed),
-        "startup": startup.snapshot(),
+        "startup": state,
     }
     try:
         save_path.parent.mkdir(parents=True, exist_ok=True)
-        with save_path.open("w", encoding="utf-8") as handle:
-            json.dump(snapshot, handle, indent=2)
+        write_json(save_path, snapshot)
+        _LAST_SAVE = (save_path.resolve(), save_path.stat().st_mtime_ns, state)
     except Exception as exc:  # pragma: no cover - defensive
         print(f"Failed to save game: {exc}")
 
@@ -69,12 +106,15 @@ def save_game(startup: Startup, path: Path | None = None) -> None:
 def load_game(path: Path | None = None) -> Startup | None:
     """Load a saved :class:`Startup` instance from disk."""
 
+    global _LAST_SAVE
+
+    # The loaded game starts a new session; never skip its first save.
+    _LAST_SAVE = None
     save_path = path or SAVE_PATH
     try:
         if not save_path.exists():
             return None
-        with save_path.open("r", encoding="utf-8") as handle:
-            data = json.load(handle)
+        data = read_json(save_path)
     except Exception as exc:  # pragma: no cover - defensive
         print(f"Failed to load game: {exc}")
         return None
@@ -2,12 +2,17 @@
 from __future__ import annotations
 
 from dataclasses import dataclass, field
+import math
+from operator import attrgetter
+from types import MappingProxyType
 from typing import Any, ClassVar, Dict, Iterable, List, Mapping, Tuple
 
 from . import config
 
 
-DEFAULT_BASELINE_STATE: Dict[str, Any] = {
+# Read-only: the dataclass defaults below are taken from it once, when the
+# class is created, so later edits would never reach new instances.
+DEFAULT_BASELINE_STATE: Mapping[str, Any] = MappingProxyType({
     "balance": 500_000,
     "monthly_revenue": 45_000,
     "monthly_expenses": 110_000,
@@ -19,7 +24,48 @@ DEFAULT_BASELINE_STATE: Dict[str, Any] = {
     "team_morale": 70.0,
     "headcount": 18,
     "debt": 0,
-}
+})
+
+
+_ACTIVE_DELIMITER = ":"
+
+# Valuation weights and bug-rate scaling, read from config once at import.
+_REVENUE_WEIGHT = config.COMPANY_VALUE_WEIGHTS.get("revenue", 0.0)
+_MARKET_SHARE_WEIGHT = config.COMPANY_VALUE_WEIGHTS.get("market_share", 0.0)
+_REPUTATION_WEIGHT = config.COMPANY_VALUE_WEIGHTS.get("reputation", 0.0)
+_TEAM_SIZE_WEIGHT = config.COMPANY_VALUE_WEIGHTS.get("team_size", 0.0)
+_BUG_RATE_WEIGHT = config.COMPANY_VALUE_WEIGHTS.get("bug_rate", 0.0)
+_EXPENSE_WEIGHT = config.COMPANY_EXPENSE_WEIGHT
+_METRIC_MINIMUM = config.METRIC_VALUE_RANGE[0]
+_METRIC_SPAN = max(1.0, config.METRIC_VALUE_RANGE[1] - _METRIC_MINIMUM)
+_PROBABILITY_LOW, _PROBABILITY_HIGH = config.PROBABILITY_RANGE
+
+
+def _decode_active_events(values: Iterable[str]) -> Dict[str, int]:
+    """Decode the ``"event_id:turns"`` entries used by saved snapshots."""
+
+    decoded: Dict[str, int] = {}
+    for entry in values:
+        if not isinstance(entry, str):  # pragma: no cover - safeguard
+            continue
+        event_id, delimiter, remaining = entry.partition(_ACTIVE_DELIMITER)
+        turns_remaining = 0
+        if delimiter:
+            try:
+                turns_remaining = int(remaining)
+            except ValueError:
+                pass
+            if turns_remaining < 0:
+                turns_remaining = 0
+        if event_id:
+            decoded[event_id] = turns_remaining
+    return decoded
+
+
+def _encode_active_events(values: Mapping[str, int]) -> List[str]:
+    # Turn counts are non-negative ints: decoding clamps them and the event
+    # code only ever stores durations or decremented durations.
+    return [f"{event_id}{_ACTIVE_DELIMITER}{turns}" for event_id, turns in values.items()]
 
 
 @dataclass(slots=True)
@@ -28,6 +74,10 @@ class Startup:
 
     Monetary values are tracked as whole dollars (not floats) to avoid precision
     drift when repeatedly applying changes.
+
+    ``active_events`` maps event ids to their remaining turns while the game
+    runs; it is only converted to the ``"event_id:turns"`` string form when a
+    snapshot is taken or restored.
     """
 
     balance: int = DEFAULT_BASELINE_STATE["balance"]
@@ -43,80 +93,90 @@ class Startup:
     debt: int = DEFAULT_BASELINE_STATE["debt"]
     turn: int = 1
     rng_seed: int = config.DEFAULT_SEED
-    active_events: List[str] = field(default_factory=list)
+    active_events: Dict[str, int] = field(default_factory=dict)
 
-    _INT_FIELDS: ClassVar[Iterable[str]] = config.STARTUP_INT_FIELDS
+    _INT_FIELDS: ClassVar[frozenset[str]] = frozenset(config.STARTUP_INT_FIELDS)
     _INT_BOUNDS: ClassVar[Mapping[str, Tuple[int, int | None]]] = config.STARTUP_INT_BOUNDS
     _PERCENT_BOUNDS: ClassVar[Mapping[str, Tuple[float, float]]] = config.STARTUP_PERCENT_BOUNDS
     _RATE_BOUNDS: ClassVar[Mapping[str, Tuple[float, float]]] = config.STARTUP_RATE_BOUNDS
+    NUMERIC_FIELDS: ClassVar[frozenset[str]] = frozenset(
+        (*config.STARTUP_INT_FIELDS, *config.STARTUP_PERCENT_BOUNDS, *config.STARTUP_RATE_BOUNDS)
+    )
+    # (field, minimum, maximum, type) for every bounded field, flattened once so
+    # clamping is a single pass with no per-field bounds lookups. Open-ended
+    # bounds become infinities so both comparisons always apply.
+    _CLAMP_TABLE: ClassVar[Tuple[Tuple[str, float, float, type], ...]] = tuple(
+        (
+            name,
+            -math.inf if low is None else low,
+            math.inf if high is None else high,
+            cast,
+        )
+        for bounds, cast in (
+            (config.STARTUP_INT_BOUNDS, int),
+            (config.STARTUP_PERCENT_BOUNDS, float),
+            (config.STARTUP_RATE_BOUNDS, float),
+        )
+        for name, (low, high) in bounds.items()
+    )
+    # The same bounds keyed by field, so a delta only clamps what it touches.
+    _FIELD_BOUNDS: ClassVar[Dict[str, Tuple[float, float, type]]] = {
+        name: (low, high, cast) for name, low, high, cast in _CLAMP_TABLE
+    }
+
+    # Scalar fields in snapshot order, read in one C-level call by snapshot().
+    _SNAPSHOT_KEYS: ClassVar[Tuple[str, ...]] = (
+        "balance",
+        "monthly_revenue",
+        "monthly_expenses",
+        "users",
+        "growth_rate",
+        "churn_rate",
+        "product_quality",
+        "brand_awareness",
+        "team_morale",
+        "headcount",
+        "debt",
+        "turn",
+        "rng_seed",
+    )
+    _SNAPSHOT_GETTER: ClassVar[attrgetter] = attrgetter(*_SNAPSHOT_KEYS)
 
     def __post_init__(self) -> None:
         for field_name in self._INT_BOUNDS:
             setattr(self, field_name, int(getattr(self, field_name)))
-        if not isinstance(self.active_events, list):
-            self.active_events = list(self.active_events)
+        if not isinstance(self.active_events, dict):
+            self.active_events = _decode_active_events(self.active_events)
         self.clamp_all()
 
     def clamp_all(self) -> None:
         """Clamp values to sensible bounds for the simulation."""
 
-        for field_name, bounds in self._INT_BOUNDS.items():
-            if not hasattr(self, field_name):
-                continue
-            minimum, maximum = bounds
-            value = int(getattr(self, field_name))
-            if minimum is not None and value < minimum:
-                value = minimum
-            if maximum is not None and value > maximum:
-                value = maximum
-            setattr(self, field_name, value)
-        for field_name, bounds in self._PERCENT_BOUNDS.items():
-            if not hasattr(self, field_name):
-                continue
-            minimum, maximum = bounds
-            value = float(getattr(self, field_name))
+        for field_name, minimum, maximum, cast in self._CLAMP_TABLE:
+            value = getattr(self, field_name)
+            if type(value) is not cast:
+                value = cast(value)
             if value < minimum:
                 value = minimum
-            if value > maximum:
-                value = maximum
-            setattr(self, field_name, value)
-        for field_name, bounds in self._RATE_BOUNDS.items():
-            if not hasattr(self, field_name):
-                continue
-            minimum, maximum = bounds
-            value = float(getattr(self, field_name))
-            if value < minimum:
-                value = minimum
-            if value > maximum:
+            elif value > maximum:
                 value = maximum
             setattr(self, field_name, value)
 
     def compute_company_value(self) -> int:
         """Estimate the company value using a heuristic formula."""
 
-        weights = config.COMPANY_VALUE_WEIGHTS
-
-        annual_revenue = self.monthly_revenue * 12
-        revenue_component = annual_revenue * weights.get("revenue", 0.0)
-        market_share_component = self.users * weights.get("market_share", 0.0)
         reputation_score = (
             self.product_quality + self.brand_awareness + self.team_morale
         ) / 3
-        reputation_component = reputation_score * weights.get("reputation", 0.0)
-        team_component = self.headcount * weights.get("team_size", 0.0)
-        bug_penalty = self.bug_rate * weights.get("bug_rate", 0.0)
-        expense_penalty = self.monthly_expenses * 12 * config.COMPANY_EXPENSE_WEIGHT
-        debt_penalty = max(0, self.debt)
-
         value = (
             self.balance
-            + revenue_component
-            + market_share_component
-            + reputation_component
-            + team_component
-            + bug_penalty
-            - expense_penalty
-            - debt_penalty
+            + self.monthly_revenue * 12 * _REVENUE_WEIGHT
+            + self.users * _MARKET_SHARE_WEIGHT
+            + reputation_score * _REPUTATION_WEIGHT
+            + self.headcount * _TEAM_SIZE_WEIGHT
+            + self.bug_rate * _BUG_RATE_WEIGHT
+            - self.monthly_expenses * 12 * _EXPENSE_WEIGHT
+            - max(0, self.debt)
         )
         return max(0, int(round(value)))
 
@@ -124,86 +184,73 @@ class Startup:
     def bug_rate(self) -> float:
         """Return an estimated bug rate derived from product quality."""
 
-        minimum, maximum = config.METRIC_VALUE_RANGE
-        span = max(1.0, maximum - minimum)
-        quality_ratio = (self.product_quality - minimum) / span
-        low, high = config.PROBABILITY_RANGE
-        quality_ratio = max(low, min(high, quality_ratio))
-        return high - quality_ratio
+        quality_ratio = (self.product_quality - _METRIC_MINIMUM) / _METRIC_SPAN
+        if quality_ratio < _PROBABILITY_LOW:
+            quality_ratio = _PROBABILITY_LOW
+        elif quality_ratio > _PROBABILITY_HIGH:
+            quality_ratio = _PROBABILITY_HIGH
+        return _PROBABILITY_HIGH - quality_ratio
 
     def recompute_runway(self) -> int:
         """Recalculate and return the months of runway based on current burn."""
 
-        if self.monthly_expenses <= 0:
+        if self.monthly_expenses <= 0 or self.balance <= 0:
             return 0
-        return max(0, self.balance // self.monthly_expenses)
+        return self.balance // self.monthly_expenses
 
     def apply_deltas(self, deltas: Mapping[str, int | float]) -> None:
-        """Apply a batch of changes to the startup state."""
+        """Apply a batch of changes to the startup state.
+
+        Each bounded field is rounded (for integer fields) and clamped as it is
+        updated, so only the fields named in *deltas* are touched.
+        """
 
+        field_bounds = self._FIELD_BOUNDS
         for key, delta in deltas.items():
-            if not hasattr(self, key):
-                raise KeyError(f"Unknown startup attribute: {key}")
-            if key == "active_events":
-                raise ValueError("Cannot apply numeric delta to active_events list.")
-            current = getattr(self, key)
-            if isinstance(current, list):  # pragma: no cover - safeguard
-                raise ValueError(f"Cannot apply numeric delta to list field '{key}'.")
-            new_value = current + delta  # type: ignore[operator]
-            if key in self._INT_FIELDS:
-                new_value = int(round(new_value))
-            setattr(self, key, new_value)
-        self.clamp_all()
+            bounds = field_bounds.get(key)
+            if bounds is None:
+                self._check_delta_target(key)
+                setattr(self, key, getattr(self, key) + delta)
+                continue
+            minimum, maximum, cast = bounds
+            value = getattr(self, key) + delta
+            if cast is int:
+                if type(value) is not int:
+                    value = int(round(value))
+            elif type(value) is not float:
+                value = float(value)
+            if value < minimum:
+                value = minimum
+            elif value > maximum:
+                value = maximum
+            setattr(self, key, value)
+
+    def _check_delta_target(self, key: str) -> None:
+        """Reject deltas aimed at attributes that are not plain numbers."""
+
+        if not hasattr(self, key):
+            raise KeyError(f"Unknown startup attribute: {key}")
+        if key == "active_events":
+            raise ValueError("Cannot apply numeric delta to active_events.")
+        if isinstance(getattr(self, key), (list, dict)):  # pragma: no cover - safeguard
+            raise ValueError(f"Cannot apply numeric delta to container field '{key}'.")
 
     def snapshot(self) -> Dict[str, Any]:
         """Return a serialisable snapshot of the startup state."""
 
-        return {
-            "balance": self.balance,
-            "monthly_revenue": self.monthly_revenue,
-            "monthly_expenses": self.monthly_expenses,
-            "users": self.users,
-            "growth_rate": self.growth_rate,
-            "churn_rate": self.churn_rate,
-            "product_quality": self.product_quality,
-            "brand_awareness": self.brand_awareness,
-            "team_morale": self.team_morale,
-            "headcount": self.headcount,
-            "debt": self.debt,
-            "turn": self.turn,
-            "rng_seed": self.rng_seed,
-            "active_events": list(self.active_events),
-        }
+        data = dict(zip(self._SNAPSHOT_KEYS, self._SNAPSHOT_GETTER(self)))
+        data["active_events"] = _encode_active_events(self.active_events)
+        return data
 
     @classmethod
     def from_snapshot(cls, data: Mapping[str, Any]) -> "Startup":
         """Recreate a :class:`Startup` instance from saved data."""
 
-        defaults = cls()
-        keys = (
-            "balance",
-            "monthly_revenue",
-            "monthly_expenses",
-            "users",
-            "growth_rate",
-            "churn_rate",
-            "product_quality",
-            "brand_awareness",
-            "team_morale",
-            "headcount",
-            "debt",
-            "turn",
-            "rng_seed",
-        )
-        kwargs = {key: data.get(key, getattr(defaults, key)) for key in keys}
-        for field_name in defaults._INT_BOUNDS:
-            if field_name in kwargs:
-                kwargs[field_name] = int(kwargs[field_name])
-        instance = cls(**kwargs)
-        events = data.get("active_events") or []
-        instance.active_events = list(events)
-        instance.clamp_all()
-        return instance
+        # Missing keys fall back to the dataclass defaults; __post_init__
+        # handles the integer coercion and clamping.
+        kwargs = {key: data[key] for key in cls._SNAPSHOT_KEYS if key in data}
+        events = _decode_active_events(data.get("active_events") or [])
+        return cls(**kwargs, active_events=events)
 
 
 __all__ = ["Startup", "DEFAULT_BASELINE_STATE"]
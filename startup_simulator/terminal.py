@@ -6,7 +6,7 @@ from dataclasses import dataclass
 _RESET = "\033[0m"
 
 
-@dataclass
+@dataclass(slots=True)
 class TerminalFormatter:
     """Apply minimal ANSI styling when supported."""
 
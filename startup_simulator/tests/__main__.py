@@ -12,14 +12,13 @@ PACKAGE_NAME = "startup_simulator.tests"
 
 
 def iter_test_functions(module: ModuleType) -> list[tuple[str, Callable[[], None]]]:
-    functions: list[tuple[str, Callable[[], None]]] = []
-    for name in dir(module):
-        if not name.startswith("test_"):
-            continue
-        obj = getattr(module, name)
-        if callable(obj):
-            functions.append((name, obj))
-    return functions
+    # The module's own namespace, in definition order; dir() would sort and
+    # go through getattr for every name.
+    return [
+        (name, obj)
+        for name, obj in vars(module).items()
+        if name.startswith("test_") and callable(obj)
+    ]
 
 
 def main() -> None:
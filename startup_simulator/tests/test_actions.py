@@ -1,6 +1,10 @@
 from __future__ import annotations
 
+import json
+import os
 import random
+from pathlib import Path
+from tempfile import TemporaryDirectory
 
 from startup_simulator import actions, config
 from startup_simulator.startup import Startup
@@ -107,6 +111,26 @@ def test_apply_action_handles_risk_failure() -> None:
     assert narrative.endswith("It fails badly.")
 
 
+def test_apply_action_clamps_each_stage_before_the_risk_outcome() -> None:
+    risky = actions.Action(
+        id="stage_clamp",
+        name="Stage Clamp",
+        costs={"balance": 1_000},
+        effects={"product_quality": 3.0, "monthly_expenses": -4_000},
+        risk={
+            "success_chance": 0.0,
+            "failure": {"effects": {"product_quality": -2.0, "monthly_expenses": 2_000}},
+        },
+    )
+    with PatchManager() as patches:
+        patches.setattr(actions, "ACTION_REGISTRY", {risky.id: risky})
+        state = Startup(balance=5_000, product_quality=99.0, monthly_expenses=1_500)
+        updated, _ = actions.apply_action(state, "stage_clamp", random.Random(0))
+
+    assert updated.product_quality == 98.0
+    assert updated.monthly_expenses == 2_000
+
+
 def test_unknown_action_raises() -> None:
     with expect_raises(ValueError, "Unknown action id: does_not_exist"):
         actions.apply_action(Startup(), "does_not_exist", random.Random(0))
@@ -129,3 +153,71 @@ def test_validate_action_limit() -> None:
 
     with expect_raises(ValueError):
         actions.validate_action_limit({"limited": 0, "other": 3}, limited, max_actions=1)
+
+    with expect_raises(ValueError):
+        actions.validate_action_limit({"limited": 0}, limited, max_actions=1, total_taken=1)
+
+
+def test_load_actions_caches_until_file_changes() -> None:
+    data = [{"id": "cached", "name": "Cached", "costs": {"balance": 100}}]
+
+    with TemporaryDirectory() as tmp_dir:
+        action_file = Path(tmp_dir) / "actions.json"
+        action_file.write_text(json.dumps(data), encoding="utf-8")
+        first = actions.load_actions(action_file)
+        second = actions.load_actions(action_file)
+
+        data[0]["name"] = "Reloaded"
+        action_file.write_text(json.dumps(data), encoding="utf-8")
+        stat = action_file.stat()
+        os.utime(action_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+        third = actions.load_actions(action_file)
+
+    assert first is not second
+    assert first["cached"] is second["cached"]
+    assert third["cached"].name == "Reloaded"
+
+
+def test_load_actions_rejects_unknown_attributes() -> None:
+    data = [{"id": "broken", "effects": {"not_a_metric": 1.0}}]
+
+    with TemporaryDirectory() as tmp_dir:
+        action_file = Path(tmp_dir) / "actions.json"
+        action_file.write_text(json.dumps(data), encoding="utf-8")
+        with expect_raises(ValueError, "not_a_metric"):
+            actions.load_actions(action_file)
+
+
+def test_insufficient_balance_reports_whole_dollar_cost() -> None:
+    data = [{"id": "expensive", "name": "Expensive", "costs": {"balance": 5000}}]
+
+    with TemporaryDirectory() as tmp_dir:
+        action_file = Path(tmp_dir) / "actions.json"
+        action_file.write_text(json.dumps(data), encoding="utf-8")
+        registry = actions.load_actions(action_file)
+
+    with PatchManager() as patches:
+        patches.setattr(actions, "ACTION_REGISTRY", registry)
+        with expect_raises(
+            ValueError,
+            "Insufficient balance to perform action 'Expensive'. Required 5000, have 1000.",
+        ):
+            actions.apply_action(Startup(balance=1_000), "expensive", random.Random(1))
+
+
+def test_list_actions_follows_a_swapped_registry() -> None:
+    cheap = actions.Action(id="cheap", name="Cheap", costs={"balance": 1_000})
+    pricey = actions.Action(id="pricey", name="Pricey", costs={"balance": 10_000})
+    state = Startup(balance=5_000)
+
+    with expect_raises(TypeError):
+        actions.get_registry()["cheap"] = cheap  # type: ignore[index]
+
+    with PatchManager() as patches:
+        patches.setattr(actions, "ACTION_REGISTRY", {pricey.id: pricey})
+        before = actions.list_actions(state)
+        patches.setattr(actions, "ACTION_REGISTRY", {pricey.id: pricey, cheap.id: cheap})
+        after = actions.list_actions(state)
+
+    assert before == []
+    assert [action.id for action in after] == ["cheap"]
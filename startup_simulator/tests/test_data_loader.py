@@ -0,0 +1,45 @@
+from __future__ import annotations
+
+import json
+from pathlib import Path
+from tempfile import TemporaryDirectory
+
+from startup_simulator import data_loader
+from startup_simulator.tests.utils import PatchManager
+
+
+def test_read_json_matches_stdlib_parser() -> None:
+    data = [
+        {
+            "id": "café_launch",
+            "trigger_chance": 0.25,
+            "duration_turns": 3,
+            "effects": {"balance": -1500, "brand_awareness": 4.5},
+            "narrative": "Espresso-fuelled ☕ launch week.",
+        }
+    ]
+
+    with TemporaryDirectory() as tmp_dir:
+        data_file = Path(tmp_dir) / "events.json"
+        data_file.write_text(json.dumps(data, ensure_ascii=False), encoding="utf-8")
+        preferred = data_loader.read_json(data_file)
+        with PatchManager() as patches:
+            patches.setattr(data_loader, "orjson", None)
+            fallback = data_loader.read_json(data_file)
+
+    assert preferred == fallback == data
+
+
+def test_write_json_round_trips_with_either_backend() -> None:
+    data = {"version": "1.0", "startup": {"balance": 750_000, "active_events": ["pr_boost:1"]}}
+
+    with TemporaryDirectory() as tmp_dir:
+        preferred_file = Path(tmp_dir) / "preferred.json"
+        fallback_file = Path(tmp_dir) / "fallback.json"
+        data_loader.write_json(preferred_file, data)
+        with PatchManager() as patches:
+            patches.setattr(data_loader, "orjson", None)
+            data_loader.write_json(fallback_file, data)
+
+        assert json.loads(preferred_file.read_text(encoding="utf-8")) == data
+        assert json.loads(fallback_file.read_text(encoding="utf-8")) == data
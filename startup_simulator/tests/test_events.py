@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import json
+import os
 import random
 from pathlib import Path
 from tempfile import TemporaryDirectory
@@ -39,6 +40,26 @@ def test_load_events_returns_game_events() -> None:
     assert startup.balance == initial_balance + 1500
 
 
+def test_load_events_caches_until_file_changes() -> None:
+    data = [{"id": "cached", "name": "Cached", "trigger_chance": 0.1}]
+
+    with TemporaryDirectory() as tmp_dir:
+        event_file = Path(tmp_dir) / "events.json"
+        event_file.write_text(json.dumps(data), encoding="utf-8")
+        first = load_events(event_file)
+        second = load_events(event_file)
+
+        data[0]["name"] = "Reloaded"
+        event_file.write_text(json.dumps(data), encoding="utf-8")
+        stat = event_file.stat()
+        os.utime(event_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+        third = load_events(event_file)
+
+    assert first is not second
+    assert first[0] is second[0]
+    assert third[0].name == "Reloaded"
+
+
 def test_event_lifecycle_triggers_and_reverts() -> None:
     def apply_fn(startup: Startup) -> None:
         startup.apply_deltas({"team_morale": -10.0})
@@ -66,16 +87,16 @@ def test_event_lifecycle_triggers_and_reverts() -> None:
         assert updated is startup
         assert narratives == [custom_event.narrative]
         assert startup.team_morale == 60.0
-        assert startup.active_events == ["stress_wave:2"]
+        assert startup.active_events == {"stress_wave": 2}
 
         messages = tick_active_events(startup)
         assert messages == []
-        assert startup.active_events == ["stress_wave:1"]
+        assert startup.active_events == {"stress_wave": 1}
         assert startup.team_morale == 60.0
 
         messages = tick_active_events(startup)
         assert messages == ["Stress Wave has concluded."]
-        assert startup.active_events == []
+        assert startup.active_events == {}
         assert startup.team_morale == 70.0
 
 
@@ -104,3 +125,47 @@ def test_event_trigger_is_deterministic_with_seed() -> None:
 
     assert startup_one.brand_awareness == startup_two.brand_awareness
     assert startup_one.active_events == startup_two.active_events
+
+
+def test_first_matching_event_wins_with_independent_odds() -> None:
+    def noop(startup: Startup) -> None:
+        return None
+
+    first = GameEvent(id="a_first", name="First", trigger_chance=0.5, duration_turns=1, apply=noop)
+    second = GameEvent(id="b_second", name="Second", trigger_chance=0.5, duration_turns=1, apply=noop)
+
+    counts = {first.name: 0, second.name: 0}
+    with PatchManager() as patches:
+        patches.setattr(events, "EVENT_REGISTRY", {first.id: first, second.id: second})
+        patches.setattr(events.config, "EVENT_PROBABILITY_WEIGHT", 1.0)
+        rng = random.Random(7)
+        trials = 4000
+        for _ in range(trials):
+            _, narratives = maybe_trigger_event(Startup(), rng)
+            for name in counts:
+                if narratives == [f"{name} occurs."]:
+                    counts[name] += 1
+
+    assert abs(counts[first.name] / trials - 0.5) < 0.03
+    assert abs(counts[second.name] / trials - 0.25) < 0.03
+
+
+def test_seeded_rng_draws_once_per_event() -> None:
+    def noop(startup: Startup) -> None:
+        return None
+
+    first = GameEvent(id="a_first", name="First", trigger_chance=0.5, duration_turns=1, apply=noop)
+    second = GameEvent(id="b_second", name="Second", trigger_chance=0.5, duration_turns=1, apply=noop)
+
+    with PatchManager() as patches:
+        patches.setattr(events, "EVENT_REGISTRY", {first.id: first, second.id: second})
+        patches.setattr(events.config, "EVENT_PROBABILITY_WEIGHT", 1.0)
+        # Seed 10 draws 0.571 then 0.429: the first event misses, the second fires.
+        rng = random.Random(10)
+        _, narratives = maybe_trigger_event(Startup(), rng)
+
+    expected = random.Random(10)
+    expected.random()
+    expected.random()
+    assert narratives == ["Second occurs."]
+    assert rng.random() == expected.random()
@@ -1,13 +1,19 @@
 """Tests for the finance helpers."""
 from __future__ import annotations
 
+import random
+
+from startup_simulator import finance
 from startup_simulator.finance import (
     FinancialSnapshot,
     apply_monthly_finances,
     calculate_runway,
     compute_runway,
+    economy_tick,
     project_growth,
 )
+from startup_simulator.startup import Startup
+from startup_simulator.tests.utils import PatchManager
 
 
 def test_financial_snapshot_properties() -> None:
@@ -36,3 +42,19 @@ def test_apply_monthly_finances_normalises_inputs() -> None:
     assert apply_monthly_finances(50_000, 10_000, 5_000) == 55_000
     assert apply_monthly_finances(50_000, -2_500, -10_000) == 47_500
     assert apply_monthly_finances(0, 0, 100_000) == -100_000
+
+
+def test_economy_tick_replays_with_the_same_seed() -> None:
+    first = Startup()
+    second = Startup()
+    untouched = Startup()
+
+    economy_tick(untouched, random.Random(21))
+    with PatchManager() as patches:
+        patches.setattr(finance.config, "ECONOMY_TICK_ENABLED", True)
+        economy_tick(first, random.Random(21))
+        economy_tick(second, random.Random(21))
+
+    assert untouched.snapshot() == Startup().snapshot()
+    assert first.snapshot() == second.snapshot()
+    assert first.monthly_revenue != Startup().monthly_revenue
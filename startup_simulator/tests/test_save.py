@@ -1,16 +1,29 @@
 from __future__ import annotations
 
-from datetime import datetime, timezone
 import json
+from pathlib import Path
 
 from startup_simulator import save_system
 from startup_simulator.startup import Startup
-from startup_simulator.tests.utils import temporary_save_path
+from startup_simulator.tests.utils import PatchManager, temporary_save_path
+
+
+# A well-formed save from an unsupported schema version; encoded once since
+# only the version field matters to the test using it.
+_MISMATCHED_VERSION_PAYLOAD = json.dumps(
+    {
+        "version": "0.0",
+        "timestamp": "1970-01-01T00:00:00+00:00",
+        "turn": 1,
+        "rng_seed": 42,
+        "startup": Startup().snapshot(),
+    }
+)
 
 
 def test_save_and_load_roundtrip() -> None:
     startup = Startup(balance=750_000, turn=5, rng_seed=99)
-    startup.active_events.append("launch_party")
+    startup.active_events["launch_party"] = 1
     with temporary_save_path(save_system):
         save_system.save_game(startup)
         loaded = save_system.load_game()
@@ -32,12 +45,41 @@ def test_load_game_with_corrupted_file() -> None:
 
 def test_load_game_with_schema_mismatch() -> None:
     with temporary_save_path(save_system) as path:
-        payload = {
-            "version": "0.0",
-            "timestamp": datetime.now(timezone.utc).isoformat(),
-            "turn": 1,
-            "rng_seed": 42,
-            "startup": Startup().snapshot(),
-        }
-        path.write_text(json.dumps(payload), encoding="utf-8")
+        path.write_text(_MISMATCHED_VERSION_PAYLOAD, encoding="utf-8")
         assert save_system.load_game() is None
+
+
+def test_save_game_skips_unchanged_state() -> None:
+    startup = Startup(balance=600_000, turn=3)
+    with temporary_save_path(save_system) as path:
+        save_system.save_game(startup)
+        first_write = path.stat().st_mtime_ns
+        save_system.save_game(startup)
+        assert path.stat().st_mtime_ns == first_write
+
+        startup.balance += 1_000
+        save_system.save_game(startup)
+        loaded = save_system.load_game()
+
+    assert loaded is not None
+    assert loaded.balance == 601_000
+
+
+def test_save_game_writes_again_after_a_load() -> None:
+    startup = Startup(balance=600_000, turn=3)
+    writes: list[Path] = []
+    write_json = save_system.write_json
+
+    def counting_write(path: Path, payload: object) -> None:
+        writes.append(path)
+        write_json(path, payload)
+
+    with temporary_save_path(save_system):
+        with PatchManager() as patches:
+            patches.setattr(save_system, "write_json", counting_write)
+            save_system.save_game(startup)
+            loaded = save_system.load_game()
+            assert loaded is not None
+            save_system.save_game(loaded)
+
+    assert len(writes) == 2
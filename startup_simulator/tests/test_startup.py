@@ -50,3 +50,10 @@ def test_compute_company_value_clamps_to_zero() -> None:
     )
 
     assert startup.compute_company_value() == 0
+
+
+def test_active_events_snapshot_uses_encoded_strings() -> None:
+    startup = Startup.from_snapshot({"active_events": ["server_crash:2", "pr_boost"]})
+
+    assert startup.active_events == {"server_crash": 2, "pr_boost": 0}
+    assert startup.snapshot()["active_events"] == ["server_crash:2", "pr_boost:0"]
@@ -4,6 +4,9 @@ from pathlib import Path
 from typing import Any, Generator, Tuple, Type
 
 
+_MISSING = object()
+
+
 class PatchManager:
     """Simple attribute patcher that restores values after use."""
 
@@ -31,17 +34,24 @@ class PatchManager:
         self.reset()
 
 
-@contextmanager
-def expect_raises(exception: Type[BaseException], match: str | None = None) -> Generator[None, None, None]:
+class expect_raises:
     """Context manager asserting that *exception* is raised."""
 
-    try:
-        yield
-    except exception as exc:  # pragma: no cover - exercised in tests
-        if match is not None and match not in str(exc):
-            raise AssertionError(f"Expected '{match}' to appear in '{exc}'.") from exc
-    else:
-        raise AssertionError(f"Expected {exception.__name__} to be raised.")
+    def __init__(self, exception: Type[BaseException], match: str | None = None) -> None:
+        self.exception = exception
+        self.match = match
+
+    def __enter__(self) -> None:
+        return None
+
+    def __exit__(self, exc_type, exc, tb) -> bool:  # type: ignore[override]
+        if exc_type is None:
+            raise AssertionError(f"Expected {self.exception.__name__} to be raised.")
+        if not issubclass(exc_type, self.exception):
+            return False
+        if self.match is not None and self.match not in str(exc):
+            raise AssertionError(f"Expected '{self.match}' to appear in '{exc}'.") from exc
+        return True
 
 
 @contextmanager
@@ -50,6 +60,12 @@ def temporary_save_path(save_module: Any) -> Generator[Path, None, None]:
 
     with tempfile.TemporaryDirectory() as tmp_dir:
         path = Path(tmp_dir) / "save.json"
-        with PatchManager() as patches:
-            patches.setattr(save_module, "SAVE_PATH", path)
+        original = getattr(save_module, "SAVE_PATH", _MISSING)
+        save_module.SAVE_PATH = path
+        try:
             yield path
+        finally:
+            if original is _MISSING:
+                del save_module.SAVE_PATH
+            else:
+                save_module.SAVE_PATH = original
@@ -8,45 +8,40 @@ leans on :mod:`textwrap` for wrapping narrative paragraphs.
 from __future__ import annotations
 
 import textwrap
-from typing import Iterable, Mapping
+from operator import attrgetter
+from typing import Callable, Dict, Iterable, List, Mapping, Tuple
 
 from . import config, terminal
 from .actions import Action
 from .startup import Startup
 
 
-_CURRENCY_FIELDS = {
-    "balance",
-    "monthly_revenue",
-    "monthly_expenses",
-    "company_value",
-    "debt",
+# Shared wrappers so each wrapped paragraph does not build a new TextWrapper.
+_PARAGRAPH_WRAPPER = textwrap.TextWrapper(width=80)
+_INDENTED_WRAPPER = textwrap.TextWrapper(width=80, initial_indent="    ", subsequent_indent="    ")
+_BULLET_WRAPPER = textwrap.TextWrapper(width=80, initial_indent="  • ", subsequent_indent="    ")
+
+_LABEL_OVERRIDES = {
+    "monthly_revenue": "Monthly Revenue",
+    "monthly_expenses": "Monthly Expenses",
+    "product_quality": "Product Quality",
+    "brand_awareness": "Brand Awareness",
+    "team_morale": "Team Morale",
+    "company_value": "Company Value",
 }
-_PERCENT_FIELDS = {"growth_rate", "churn_rate"}
-_SCORE_FIELDS = {"product_quality", "brand_awareness", "team_morale"}
-_INT_FIELDS = {"users", "headcount", "turn"}
 
 
 def _label_for(field: str) -> str:
     """Return a human-friendly label for a field name."""
 
-    overrides = {
-        "monthly_revenue": "Monthly Revenue",
-        "monthly_expenses": "Monthly Expenses",
-        "product_quality": "Product Quality",
-        "brand_awareness": "Brand Awareness",
-        "team_morale": "Team Morale",
-        "company_value": "Company Value",
-    }
-    if field in overrides:
-        return overrides[field]
-    return field.replace("_", " ").title()
+    return _LABEL_OVERRIDES.get(field) or field.replace("_", " ").title()
 
 
 def _format_currency(value: float | int) -> str:
+    if type(value) is int:
+        return f"${value:,}" if value >= 0 else f"-${-value:,}"
     sign = "-" if value < 0 else ""
-    amount = abs(int(round(value)))
-    return f"{sign}${amount:,}"
+    return f"{sign}${abs(int(round(value))):,}"
 
 
 def _format_percentage(value: float) -> str:
@@ -54,27 +49,51 @@ def _format_percentage(value: float) -> str:
 
 
 def _format_score(value: float) -> str:
+    if type(value) is int:
+        return f"{value}"
+    # A tolerance rather than is_integer(): accumulated float deltas such as
+    # 60.00000000000001 should still render as a whole score.
     if abs(value - round(value)) < 1e-9:
         return f"{int(round(value))}"
     return f"{value:.1f}"
 
 
-def _format_value(field: str, value: float | int) -> str:
-    """Format *value* appropriately for the given *field* name."""
+def _format_count(value: float | int) -> str:
+    if type(value) is not int:
+        value = int(round(value))
+    return f"{value:,}"
+
 
-    if field in _CURRENCY_FIELDS:
-        return _format_currency(value)
-    if field in _PERCENT_FIELDS:
-        return _format_percentage(float(value))
-    if field in _SCORE_FIELDS:
-        return _format_score(float(value))
-    if field in _INT_FIELDS:
-        return f"{int(round(value)):,}"
+def _format_plain(value: float | int) -> str:
     if isinstance(value, float) and abs(value - round(value)) < 1e-9:
         return f"{int(round(value))}"
     return f"{value}"
 
 
+# Field name -> formatter; fields not listed fall back to ``_format_plain``.
+_FIELD_FORMATTERS: Dict[str, Callable[[float | int], str]] = {
+    "balance": _format_currency,
+    "monthly_revenue": _format_currency,
+    "monthly_expenses": _format_currency,
+    "company_value": _format_currency,
+    "debt": _format_currency,
+    "growth_rate": _format_percentage,
+    "churn_rate": _format_percentage,
+    "product_quality": _format_score,
+    "brand_awareness": _format_score,
+    "team_morale": _format_score,
+    "users": _format_count,
+    "headcount": _format_count,
+    "turn": _format_count,
+}
+
+
+def _format_value(field: str, value: float | int) -> str:
+    """Format *value* appropriately for the given *field* name."""
+
+    return _FIELD_FORMATTERS.get(field, _format_plain)(value)
+
+
 def _format_delta(field: str, amount: float | int, *, invert: bool = False) -> str:
     """Return a signed delta string for a metric change."""
 
@@ -86,54 +105,51 @@ def _format_delta(field: str, amount: float | int, *, invert: bool = False) -> s
     return f"{sign}{value} {_label_for(field)}"
 
 
+_TAGLINE = _PARAGRAPH_WRAPPER.fill(
+    "Guide your fledgling company through funding, growth, and tough "
+    "decisions one turn at a time."
+)
+
+
 def render_title() -> str:
     """Return the main title banner for the CLI."""
 
     title = config.GAME_TITLE
     bar = "=" * len(title)
-    tagline = textwrap.fill(
-        "Guide your fledgling company through funding, growth, and tough "
-        "decisions one turn at a time.",
-        width=80,
-    )
-    return f"{bar}\n{title}\n{bar}\n{tagline}"
+    return f"{bar}\n{title}\n{bar}\n{_TAGLINE}"
+
+
+# (label, value getter, formatter) for one dashboard line.
+_DashboardRow = Tuple[str, Callable[[Startup], float | int], Callable[[float | int], str]]
+
+
+def _dashboard_row(label: str, field: str) -> _DashboardRow:
+    return (label, attrgetter(field), _FIELD_FORMATTERS.get(field, _format_plain))
+
+
+# Every dashboard line in display order, resolved once at import.
+_DASHBOARD_ROWS: Tuple[_DashboardRow, ...] = (
+    _dashboard_row("Turn", "turn"),
+    _dashboard_row("Balance", "balance"),
+    _dashboard_row("Monthly Revenue", "monthly_revenue"),
+    _dashboard_row("Monthly Expenses", "monthly_expenses"),
+    ("Company Value", Startup.compute_company_value, _FIELD_FORMATTERS["company_value"]),
+    ("Runway", Startup.recompute_runway, lambda months: f"{months} months"),
+    _dashboard_row("Users", "users"),
+    _dashboard_row("Growth Rate", "growth_rate"),
+    _dashboard_row("Churn Rate", "churn_rate"),
+    _dashboard_row("Product Quality", "product_quality"),
+    _dashboard_row("Brand Awareness", "brand_awareness"),
+    _dashboard_row("Team Morale", "team_morale"),
+    _dashboard_row("Headcount", "headcount"),
+    _dashboard_row("Debt", "debt"),
+)
 
 
 def render_dashboard(startup: Startup) -> str:
     """Create a tabular overview of the startup state."""
 
-    metrics = {
-        "turn": startup.turn,
-        "balance": startup.balance,
-        "monthly_revenue": startup.monthly_revenue,
-        "monthly_expenses": startup.monthly_expenses,
-        "users": startup.users,
-        "growth_rate": startup.growth_rate,
-        "churn_rate": startup.churn_rate,
-        "product_quality": startup.product_quality,
-        "brand_awareness": startup.brand_awareness,
-        "team_morale": startup.team_morale,
-        "headcount": startup.headcount,
-        "debt": startup.debt,
-        "company_value": startup.compute_company_value(),
-    }
-
-    formatted_items = [
-        ("Turn", _format_value("turn", metrics["turn"])),
-        ("Balance", _format_value("balance", metrics["balance"])),
-        ("Monthly Revenue", _format_value("monthly_revenue", metrics["monthly_revenue"])),
-        ("Monthly Expenses", _format_value("monthly_expenses", metrics["monthly_expenses"])),
-        ("Company Value", _format_value("company_value", metrics["company_value"])),
-        ("Runway", f"{startup.recompute_runway()} months"),
-        ("Users", _format_value("users", metrics["users"])),
-        ("Growth Rate", _format_value("growth_rate", metrics["growth_rate"])),
-        ("Churn Rate", _format_value("churn_rate", metrics["churn_rate"])),
-        ("Product Quality", _format_value("product_quality", metrics["product_quality"])),
-        ("Brand Awareness", _format_value("brand_awareness", metrics["brand_awareness"])),
-        ("Team Morale", _format_value("team_morale", metrics["team_morale"])),
-        ("Headcount", _format_value("headcount", metrics["headcount"])),
-        ("Debt", _format_value("debt", metrics["debt"])),
-    ]
+    formatted_items = [(label, fmt(get(startup))) for label, get, fmt in _DASHBOARD_ROWS]
 
     label_width = max(len(label) for label, _ in formatted_items)
     value_width = max(len(value) for _, value in formatted_items)
@@ -154,13 +170,7 @@ def render_events(narratives: list[str]) -> str:
 
     wrapped = []
     for narrative in narratives:
-        paragraph = textwrap.fill(
-            narrative,
-            width=80,
-            initial_indent="  • ",
-            subsequent_indent="    ",
-        )
-        wrapped.append(paragraph)
+        wrapped.append(_BULLET_WRAPPER.fill(narrative))
     return "\n".join([terminal.header("Recent Events:")] + wrapped)
 
 
@@ -173,40 +183,59 @@ def _format_changes(changes: Mapping[str, float | int], *, invert: bool = False)
     return "; ".join(parts)
 
 
+def _action_details(action: Action) -> List[str]:
+    """Return the indented description lines shown under an action's name."""
+
+    lines: List[str] = []
+    if action.narrative:
+        lines.append(_INDENTED_WRAPPER.fill(action.narrative))
+    if action.costs:
+        lines.append(f"    Cost: {_format_changes(action.costs, invert=True)}")
+    else:
+        lines.append("    Cost: None")
+    if action.effects:
+        lines.append(f"    Effects: {_format_changes(action.effects)}")
+    else:
+        lines.append("    Effects: None")
+    if action.max_per_turn is not None:
+        lines.append(f"    Limit: {action.max_per_turn} per turn")
+    if action.risk and "success_chance" in action.risk:
+        chance = action.risk["success_chance"]
+        chance_line = f"    Risk: {chance * 100:.0f}% success chance"
+        lines.append(chance_line)
+    return lines
+
+
+# Rendered detail lines keyed by action id. The action itself is kept
+# alongside so a reloaded registry with a new definition is re-rendered.
+_ACTION_DETAILS_CACHE: Dict[str, Tuple[Action, List[str]]] = {}
+
+
+def _cached_action_details(action: Action) -> List[str]:
+    cached = _ACTION_DETAILS_CACHE.get(action.id)
+    if cached is None or cached[0] is not action:
+        cached = (action, _action_details(action))
+        _ACTION_DETAILS_CACHE[action.id] = cached
+    return cached[1]
+
+
 def render_actions_menu(actions: list[Action]) -> str:
-    """Format an action selection menu for the CLI."""
+    """Format an action selection menu for the CLI.
+
+    Each action's description block never changes, so it is rendered once and
+    reused; only the numbering depends on which actions are on offer.
+    """
 
     if not actions:
         return "No actions are currently available."
 
     lines = [terminal.header("Available Actions:")]
     for index, action in enumerate(actions, start=1):
+        if index > 1:
+            lines.append("")
         lines.append(f"{index}. {action.name}")
-        if action.narrative:
-            lines.append(
-                textwrap.fill(
-                    action.narrative,
-                    width=80,
-                    initial_indent="    ",
-                    subsequent_indent="    ",
-                )
-            )
-        if action.costs:
-            lines.append(f"    Cost: {_format_changes(action.costs, invert=True)}")
-        else:
-            lines.append("    Cost: None")
-        if action.effects:
-            lines.append(f"    Effects: {_format_changes(action.effects)}")
-        else:
-            lines.append("    Effects: None")
-        if action.max_per_turn is not None:
-            lines.append(f"    Limit: {action.max_per_turn} per turn")
-        if action.risk and "success_chance" in action.risk:
-            chance = action.risk["success_chance"]
-            chance_line = f"    Risk: {chance * 100:.0f}% success chance"
-            lines.append(chance_line)
-        lines.append("")
-    return "\n".join(lines).rstrip()
+        lines.extend(_cached_action_details(action))
+    return "\n".join(lines)
 
 
 def prompt_choose_actions(max_actions: int) -> str:
@@ -219,7 +248,7 @@ def prompt_choose_actions(max_actions: int) -> str:
         f"Choose up to {max_actions} action{plural} by typing their numbers separated by commas. "
         "Press Enter to continue without taking further actions."
     )
-    return textwrap.fill(instruction, width=80)
+    return _PARAGRAPH_WRAPPER.fill(instruction)
 
 
 def format_menu(options: Iterable[str]) -> str: